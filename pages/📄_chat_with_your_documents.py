@@ -1,11 +1,9 @@
 # Import necessary libraries
-import os
 import numpy as np
 import streamlit as st
 import utils  # ✅ Now using utility functions
 from langchain.memory import ConversationBufferMemory
 from langchain.chains import ConversationalRetrievalChain
-from langchain_community.document_loaders import PyPDFLoader
 from langchain_community.vectorstores import FAISS  # ✅ Use FAISS instead of DocArrayInMemorySearch
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain.schema import Document  # ✅ Needed for FAISS storage
@@ -27,24 +25,13 @@ class CustomDocChatbot:
         self.embedding_model = utils.configure_embedding_model()  # ✅ Load SentenceTransformer from utils
         self.faiss_embeddings = utils.configure_vector_embeddings()  # ✅ Load FAISS-compatible embeddings
     
-    def save_file(self, file):
-        """Save the uploaded PDF to a temporary folder."""
-        folder = "tmp"
-        os.makedirs(folder, exist_ok=True)
-        file_path = os.path.join(folder, file.name)
-        with open(file_path, "wb") as f:
-            f.write(file.getvalue())
-        return file_path
-
-    def setup_qa_chain(self, uploaded_files):
-        """Processes uploaded PDFs and sets up the Q&A retrieval system with FAISS."""
+    def setup_vector_db(self, uploaded_files):
+        """Processes uploaded PDFs and builds the FAISS vector store."""
 
         # Load and process documents
         docs = []
         for file in uploaded_files:
-            file_path = self.save_file(file)
-            loader = PyPDFLoader(file_path)
-            docs.extend(loader.load())
+            docs.extend(utils.load_pdf(file))  # ✅ Parse straight from the upload buffer
 
         # Split documents into smaller chunks
         text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
@@ -57,11 +44,14 @@ class CustomDocChatbot:
         text_embeddings = self.embedding_model.encode(texts)
         text_embeddings = np.array(text_embeddings)  # Convert to numpy array
 
-        # ✅ Convert texts into LangChain Document objects for FAISS
-        faiss_docs = [Document(page_content=text) for text in texts]
+        # ✅ Convert chunks into LangChain Document objects for FAISS, keeping source/page metadata
+        faiss_docs = [Document(page_content=doc.page_content, metadata=doc.metadata) for doc in splits]
 
         # ✅ Initialize FAISS vector store
-        vector_db = FAISS.from_documents(faiss_docs, self.faiss_embeddings)
+        return FAISS.from_documents(faiss_docs, self.faiss_embeddings)
+
+    def setup_qa_chain(self, vector_db):
+        """Sets up the Q&A retrieval system on top of the FAISS vector store."""
 
         # Define retriever
         retriever = vector_db.as_retriever(search_type="mmr", search_kwargs={"k": 2, "fetch_k": 4})
@@ -91,7 +81,12 @@ class CustomDocChatbot:
         user_query = st.chat_input(placeholder="🔎 Ask something about your document!")
 
         if uploaded_files and user_query:
-            qa_chain = self.setup_qa_chain(uploaded_files)
+            # ✅ Rebuild the FAISS index only when the uploaded content changes
+            files_key = utils.upload_digests(uploaded_files)
+            if st.session_state.get("vector_db_key") != files_key:
+                st.session_state["vector_db"] = self.setup_vector_db(uploaded_files)
+                st.session_state["vector_db_key"] = files_key
+            qa_chain = self.setup_qa_chain(st.session_state["vector_db"])
 
             utils.display_msg(user_query, "user")  # ✅ Store and display user's message
 
@@ -1,5 +1,6 @@
 # Import required libraries
 import os  # Used for environment variable access
+import hashlib  # Used for hashing uploaded files
 import streamlit as st  # Streamlit for building UI
 from datetime import datetime  # Used for logging timestamps
 from streamlit.logger import get_logger  # Streamlit's built-in logger
@@ -7,6 +8,8 @@ from sentence_transformers import SentenceTransformer  # Embeddings
 from langchain.embeddings import HuggingFaceEmbeddings  # Open-source embeddings
 from langchain_groq import ChatGroq  # Groq API for LLM
 from langchain_openai import ChatOpenAI  # OpenAI API for LLM
+from langchain.schema import Document  # LangChain document container
+from pypdf import PdfReader  # Parse PDFs straight from file-like objects
 from dotenv import load_dotenv
 from streamlit_autorefresh import st_autorefresh
 load_dotenv()  # ✅ Load environment variables from .env
@@ -23,6 +26,8 @@ if not api_token:
     st.error("❌ Missing API Token!")
     st.stop()  # Stop execution if API token is missing
 
+CHUNK_SIZE = 1024 * 1024  # 1 MB slices for hashing uploads
+
 # ✅ Decorator to enable chat history
 def enable_chat_history(func):
     """
@@ -158,4 +163,60 @@ def remove_think_tags(text):
         end_index = text.find(end_tag) + len(end_tag)
         if start_index < end_index:
             text = text[:start_index] + text[end_index:]
-    return text
\ No newline at end of file
+    return text
+
+def _iter_chunks(view):
+    """Yields zero-copy slices of a memoryview in CHUNK_SIZE pieces."""
+    for start in range(0, len(view), CHUNK_SIZE):
+        yield view[start:start + CHUNK_SIZE]
+
+def hash_upload(file):
+    """
+    Computes a SHA-256 digest of an uploaded file in a single streaming pass.
+
+    Args:
+        file (UploadedFile): Streamlit upload (an in-memory BytesIO).
+
+    Returns:
+        str: Hex digest usable as a cache key.
+    """
+    digest = hashlib.sha256()
+    with file.getbuffer() as view:
+        for chunk in _iter_chunks(view):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def upload_digests(uploaded_files):
+    """
+    Returns the SHA-256 digests of the uploaded files, hashing each upload only once.
+
+    Digests are cached in session state under the upload's file_id, so reruns
+    triggered by new queries reuse them instead of re-reading every file.
+
+    Args:
+        uploaded_files (list[UploadedFile]): Current Streamlit uploads.
+
+    Returns:
+        tuple[str]: One digest per upload, in upload order.
+    """
+    cached = st.session_state.get("upload_digests", {})
+    digests = {file.file_id: cached.get(file.file_id) or hash_upload(file) for file in uploaded_files}
+    st.session_state["upload_digests"] = digests  # Drop digests of removed uploads
+    return tuple(digests[file.file_id] for file in uploaded_files)
+
+def load_pdf(file):
+    """
+    Parses an uploaded PDF into one LangChain Document per page.
+
+    Args:
+        file (UploadedFile): Streamlit upload containing a PDF.
+
+    Returns:
+        list[Document]: Page documents with source and page metadata.
+    """
+    file.seek(0)
+    reader = PdfReader(file)  # UploadedFile is already an in-memory BytesIO
+    return [
+        Document(page_content=page.extract_text() or "", metadata={"source": file.name, "page": i})
+        for i, page in enumerate(reader.pages)
+    ]